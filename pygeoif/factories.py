@@ -16,7 +16,10 @@
 #   Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 """Geometry Factories."""
 
+import math
 import re
+from functools import lru_cache
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Pattern
@@ -42,7 +45,6 @@ from pygeoif.types import GeoInterface
 from pygeoif.types import GeoType
 from pygeoif.types import Interiors
 from pygeoif.types import LineType
-from pygeoif.types import PointType
 from pygeoif.types import PolygonType
 
 wkt_regex: Pattern[str] = re.compile(
@@ -66,6 +68,14 @@ def get_oriented_ring(ring: LineType, ccw: bool) -> LineType:  # noqa: FBT001
     return ring if signed_area(ring) / s >= 0 else ring[::-1]
 
 
+def _orient_ring(ring: LinearRing, ccw: bool) -> LinearRing:  # noqa: FBT001
+    """Return the ring itself when it is oriented already, or a reversed ring."""
+    s = 1.0 if ccw else -1.0
+    if ring._get_signed_area() / s >= 0:
+        return ring
+    return LinearRing(ring.coords[::-1])
+
+
 def orient(polygon: Polygon, ccw: bool = True) -> Polygon:  # noqa: FBT001, FBT002
     """
     Return a polygon with exteriors and interiors in the right orientation.
@@ -73,10 +83,11 @@ def orient(polygon: Polygon, ccw: bool = True) -> Polygon:  # noqa: FBT001, FBT0
     if ccw is True than the exterior will be in counterclockwise orientation
     and the interiors will be in clockwise orientation, or
     the other way round when ccw is False.
+    Rings that are oriented correctly already are reused, not copied.
     """
-    shell = get_oriented_ring(polygon.exterior.coords, ccw)
+    shell = _orient_ring(polygon.exterior, ccw)
     ccw = not ccw  # flip orientation for holes
-    holes = [get_oriented_ring(ring.coords, ccw) for ring in polygon.interiors]
+    holes = [_orient_ring(ring, ccw) for ring in polygon.interiors]
     return Polygon(shell=shell, holes=holes)
 
 
@@ -174,54 +185,39 @@ def num(number: str) -> float:
 
     """
     f = float(number)
-    return int(f) if int(f) == f else f
+    if not math.isfinite(f):
+        msg = f"{number} is not a finite number"
+        if math.isnan(f):
+            raise ValueError(msg)
+        raise OverflowError(msg)
+    return int(f) if f.is_integer() else f
+
+
+def _coords_from_wkt(coords: Iterable[str]) -> LineType:
+    """Convert a sequence of WKT coordinate strings into coordinate tuples."""
+    return [tuple(map(num, coord.split())) for coord in coords]  # type: ignore [return-value]
 
 
 def _point_from_wkt_coordinates(coordinates: str) -> Point:
-    coords = [num(c) for c in coordinates.split()]
-    return Point(*coords)
+    return Point(*map(num, coordinates.split()))
 
 
 def _line_from_wkt_coordinates(coordinates: str) -> LineString:
-    coords = coordinates.split(",")
-    return LineString(
-        cast(
-            LineType,
-            [tuple(num(c) for c in coord.split()) for coord in coords],
-        ),
-    )
+    return LineString(_coords_from_wkt(coordinates.split(",")))
 
 
 def _ring_from_wkt_coordinates(coordinates: str) -> LinearRing:
-    coords = coordinates.split(",")
-    return LinearRing(
-        cast(
-            LineType,
-            [tuple(num(c) for c in coord.split()) for coord in coords],
-        ),
-    )
+    return LinearRing(_coords_from_wkt(coordinates.split(",")))
 
 
 def _shell_holes_from_wkt_coords(
     coords: List[str],
 ) -> Tuple[LineType, Interiors]:
     """Extract shell and holes from polygon wkt coordinates."""
-    exterior: LineType = cast(
-        LineType,
-        [tuple(num(c) for c in coord.split()) for coord in coords[0]],
-    )
+    exterior = _coords_from_wkt(coords[0])
     if len(coords) > 1:
         # we have a polygon with holes
-        interiors = [
-            cast(
-                LineType,
-                [
-                    cast(PointType, tuple(num(c) for c in coord.split()))
-                    for coord in ext
-                ],
-            )
-            for ext in coords[1:]
-        ]
+        interiors = [_coords_from_wkt(ext) for ext in coords[1:]]
     else:
         interiors = None
     return exterior, interiors
@@ -240,20 +236,12 @@ def _polygon_from_wkt_coordinates(coordinates: str) -> Polygon:
 
 def _multipoint_from_wkt_coordinates(coordinates: str) -> MultiPoint:
     coords = [coord.strip().strip("()") for coord in coordinates.split(",")]
-    return MultiPoint(
-        [cast(PointType, tuple(num(c) for c in coord.split())) for coord in coords],
-    )
+    return MultiPoint(_coords_from_wkt(coords))
 
 
 def _multiline_from_wkt_coordinates(coordinates: str) -> MultiLineString:
     coords = [
-        cast(
-            LineType,
-            [
-                tuple(num(c) for c in coord.split())
-                for coord in lines.strip("()").split(",")
-            ],
-        )
+        _coords_from_wkt(lines.strip("()").split(","))
         for lines in inner.findall(coordinates)
     ]
     return MultiLineString(coords)
@@ -347,6 +335,22 @@ def from_wkt(geo_str: str) -> Optional[Union[Geometry, GeometryCollection]]:
         raise WKTParserError(msg) from exc
 
 
+@lru_cache(maxsize=1024)
+def from_wkt_cached(
+    geo_str: str,
+) -> Optional[Union[Geometry, GeometryCollection]]:
+    """
+    Create a geometry from its WKT representation and cache the result.
+
+    Geometries are immutable, so the results for recently parsed WKT strings
+    are returned again when the same string is parsed.
+    Up to 1024 geometries, which may be arbitrarily large, are kept alive by
+    this process-wide cache.
+    Call ``from_wkt_cached.cache_clear()`` to release them.
+    """
+    return from_wkt(geo_str)
+
+
 def mapping(
     ob: Union[GeoType, GeoCollectionType],
 ) -> Union[GeoCollectionInterface, GeoInterface]:
@@ -24,6 +24,7 @@ from typing import Generator
 from typing import Iterator
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 from typing import cast
 
@@ -79,6 +80,8 @@ class Feature:
 
     """
 
+    __slots__ = ("_feature_id", "_geometry", "_properties")
+
     def __init__(
         self,
         geometry: Geometry,
@@ -90,6 +93,15 @@ class Feature:
         self._properties = properties or {}
         self._feature_id = feature_id
 
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        """Return the slots, protocols 0 and 1 do not collect them."""
+        return None, {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        """Restore the slots of a pickled or copied feature."""
+        for name, value in state[1].items():
+            setattr(self, name, value)
+
     def __eq__(self, other: object) -> bool:
         """Check if the geointerfaces are equal."""
         try:
@@ -173,10 +185,21 @@ class FeatureCollection:
 
     """
 
+    __slots__ = ("_features",)
+
     def __init__(self, features: Sequence[Feature]) -> None:
         """Initialize the feature."""
         self._features = tuple(features)
 
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        """Return the slots, protocols 0 and 1 do not collect them."""
+        return None, {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        """Restore the slots of a pickled or copied feature collection."""
+        for name, value in state[1].items():
+            setattr(self, name, value)
+
     def __eq__(self, other: object) -> bool:
         """Check if the geointerfaces are equal."""
         return self._check_interface(other) and all(
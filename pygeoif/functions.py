@@ -17,14 +17,14 @@
 #
 """Functions for geometries."""
 
-import math
-from itertools import groupby
 from itertools import zip_longest
+from math import isclose
+from math import isnan
+from math import nan
 from typing import Iterable
 from typing import List
 from typing import Tuple
 from typing import Union
-from typing import cast
 
 from pygeoif.types import CoordinatesType
 from pygeoif.types import GeoCollectionInterface
@@ -41,73 +41,76 @@ def signed_area(coords: LineType) -> float:
 
     Linear time algorithm: http://www.cgafaq.info/wiki/Polygon_Area.
     A value >= 0 indicates a counter-clockwise oriented ring.
+    A ring that is not closed is treated as if its first vertex was repeated
+    at the end.
     """
     if len(coords) < 3:  # noqa: PLR2004
         return 0.0
-    xs, ys = map(list, zip(*(coord[:2] for coord in coords)))
-    xs.append(xs[1])  # pragma: no mutate
-    ys.append(ys[1])  # pragma: no mutate
-    return cast(
-        float,
-        sum(xs[i] * (ys[i + 1] - ys[i - 1]) for i in range(1, len(coords))) / 2.0,
+    xs = [coord[0] for coord in coords]
+    ys = [coord[1] for coord in coords]
+    if xs[0] != xs[-1] or ys[0] != ys[-1]:
+        xs.append(xs[0])
+        ys.append(ys[0])
+    # pair every vertex from the second on with its neighbours, wrapping around
+    # to the second vertex after the last one, as the ring is closed.
+    ys_next = ys[2:]
+    ys_next.append(ys[1])  # pragma: no mutate
+    return (
+        sum(x * (y_next - y_prev) for x, y_prev, y_next in zip(xs[1:], ys, ys_next))
+        / 2.0
     )
 
 
 def centroid(coords: LineType) -> Tuple[Point2D, float]:
     """Calculate the coordinates of the centroid and the area of a LineString."""
-    ans: List[float] = [0, 0]
-    n = len(coords)
+    cx: float = 0
+    cy: float = 0
     signed_area = 0.0
 
-    # For all vertices
-    for i, coord in enumerate(coords):
-        next_coord = coords[(i + 1) % n]
+    # For all vertices, paired with the next one, wrapping around to the first
+    for coord, next_coord in zip(coords, (*coords[1:], *coords[:1])):
+        x, y = coord[0], coord[1]
+        next_x, next_y = next_coord[0], next_coord[1]
         # Calculate area using shoelace formula
-        area = (coord[0] * next_coord[1]) - (next_coord[0] * coord[1])
+        area = (x * next_y) - (next_x * y)
         signed_area += area
 
         # Calculate coordinates of centroid of polygon
-        ans[0] += (coord[0] + next_coord[0]) * area
-        ans[1] += (coord[1] + next_coord[1]) * area
+        cx += (x + next_x) * area
+        cy += (y + next_y) * area
 
-    if signed_area == 0 or math.isnan(signed_area):
-        return ((math.nan, math.nan), signed_area)
+    if signed_area == 0 or isnan(signed_area):
+        return ((nan, nan), signed_area)
 
-    ans[0] = ans[0] / (3 * signed_area)
-    ans[1] = ans[1] / (3 * signed_area)
-
-    return cast(Point2D, tuple(ans)), signed_area / 2.0
+    return (cx / (3 * signed_area), cy / (3 * signed_area)), signed_area / 2.0
 
 
 def dedupe(coords: LineType) -> LineType:
-    """Remove duplicate Points from a LineString."""
-    return cast(LineType, tuple(coord for coord, _count in groupby(coords)))
+    """Remove consecutive duplicate Points from a LineString."""
+    previous = None
+    # keep a coordinate only when it differs from the one kept before it.
+    return tuple(  # type: ignore [return-value]
+        [previous := coord for coord in coords if coord != previous],
+    )
 
 
-def _orientation(p: Point2D, q: Point2D, r: Point2D) -> float:
+def _hull(points: Iterable[Point2D]) -> List[Point2D]:
     """
-    Calculate orientation of three points (p, q, r).
-
-    Returns
-    -------
-    negative if counterclockwise
-    0 if colinear
-    positive if clockwise
+    Construct the upper/lower hull of a set of points.
 
+    The orientation of the last two points on the stack and the next point is
+    calculated inline, it is negative if they turn counterclockwise, 0 if they
+    are colinear and positive if they turn clockwise.
     """
-    return (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
-
-
-def _hull(points: Iterable[Point2D]) -> List[Point2D]:
-    """Construct the upper/lower hull of a set of points."""
     stack: List[Point2D] = []
-    for p in points:
-        while (
-            len(stack) >= 2  # noqa: PLR2004
-            and _orientation(stack[-2], stack[-1], p) >= 0
-        ):
+    for r in points:
+        rx, ry = r[0], r[1]
+        while len(stack) >= 2:  # noqa: PLR2004
+            p, q = stack[-2], stack[-1]
+            if (q[1] - p[1]) * (rx - q[0]) - (q[0] - p[0]) * (ry - q[1]) < 0:
+                break
             stack.pop()
-        stack.append(p)
+        stack.append(r)
     return stack
 
 
@@ -150,12 +153,12 @@ def compare_coordinates(
             for c, o in zip_longest(
                 coords,  # type: ignore [arg-type]
                 other,  # type: ignore [arg-type]
-                fillvalue=math.nan,
+                fillvalue=nan,
             )
         )
     except TypeError:
         try:
-            return math.isclose(a=cast(float, coords), b=cast(float, other))
+            return isclose(a=coords, b=other)  # type: ignore [arg-type]
         except TypeError:
             return False
 
@@ -201,12 +204,11 @@ def move_coordinate(
     (-1, 1, 0)
     """
     if len(coordinate) < len(move_by):
-        return cast(
-            PointType,
-            tuple(c + m for c, m in zip_longest(coordinate, move_by, fillvalue=0)),
+        return tuple(  # type: ignore [return-value]
+            c + m for c, m in zip_longest(coordinate, move_by, fillvalue=0)
         )
 
-    return cast(PointType, tuple(c + m for c, m in zip(coordinate, move_by)))
+    return tuple(c + m for c, m in zip(coordinate, move_by))  # type: ignore [return-value]
 
 
 def move_coordinates(
@@ -228,10 +230,10 @@ def move_coordinates(
     if not coordinates:
         return coordinates
     if isinstance(coordinates[0], (int, float)):
-        return move_coordinate(cast(PointType, coordinates), move_by)
-    return cast(
-        CoordinatesType,
-        tuple(move_coordinates(cast(CoordinatesType, c), move_by) for c in coordinates),
+        return move_coordinate(coordinates, move_by)  # type: ignore [arg-type]
+    return tuple(  # type: ignore [return-value]
+        move_coordinates(c, move_by)  # type: ignore [arg-type]
+        for c in coordinates
     )
 
 
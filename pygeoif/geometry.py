@@ -18,10 +18,14 @@
 # file deepcode ignore inconsistent~equality: Python 3 only
 """Geometries in pure Python."""
 
-import math
 import warnings
+from itertools import chain
+from itertools import starmap
+from math import isclose
+from math import isnan
 from typing import Any
-from typing import Hashable
+from typing import ClassVar
+from typing import Dict
 from typing import Iterable
 from typing import Iterator
 from typing import NoReturn
@@ -41,20 +45,41 @@ from pygeoif.functions import signed_area
 from pygeoif.types import Bounds
 from pygeoif.types import GeoCollectionInterface
 from pygeoif.types import GeoInterface
-from pygeoif.types import GeomType
 from pygeoif.types import GeoType
 from pygeoif.types import LineType
+from pygeoif.types import MultiCoordinatesType
 from pygeoif.types import Point2D
 from pygeoif.types import PointType
 from pygeoif.types import PolygonType
 
 
+def _coordinate_columns(
+    xs: Iterable[float],
+    ys: Iterable[float],
+    zs: Optional[Iterable[float]],
+) -> Tuple[Tuple[float, ...], ...]:
+    """Return the x, y and optional z values, which must be of the same length."""
+    columns = tuple(tuple(column) for column in (xs, ys, zs) if column is not None)
+    if len({len(column) for column in columns}) > 1:
+        msg = "The x, y and z sequences must have the same length"
+        raise ValueError(msg)
+    return columns
+
+
 class _Geometry:
     """Base Class for geometry objects."""
 
-    __slots__ = ("_geoms",)
+    __slots__ = ("_wkt",)
 
-    _geoms: Hashable
+    _wkt: str
+    _geom_type: ClassVar[str] = "_Geometry"
+    _wkt_type: ClassVar[str] = "_GEOMETRY"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Store the geometry type and WKT names once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._geom_type = cls.__name__
+        cls._wkt_type = cls.__name__.upper()
 
     def __setattr__(self, *args: Any) -> NoReturn:  # noqa: ANN401
         msg = f"Attributes of {self.__class__.__name__} cannot be changed"
@@ -68,33 +93,59 @@ class _Geometry:
             msg,
         )
 
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        """Return the filled slots, protocols 0 and 1 do not collect them."""
+        return None, {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        """Restore the slots of a pickled or copied geometry."""
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+
     def __str__(self) -> str:
         return self.wkt
 
-    def __eq__(self, other: object) -> bool:
+    def __eq__(self, other: object) -> bool:  # noqa: PLR0911
         """
         Check if the geometry objects have the same coordinates and type.
 
         Empty geometries are always considered as not equal.
         """
-        try:
-            return all(
-                (
-                    not self.is_empty,
-                    self.__geo_interface__["type"]
-                    == other.__geo_interface__.get(  # type: ignore [attr-defined]
-                        "type",
-                    ),
-                    compare_coordinates(
-                        coords=self.__geo_interface__["coordinates"],
-                        other=other.__geo_interface__.get(  # type: ignore [attr-defined]
-                            "coordinates",
-                        ),
-                    ),
-                ),
+        if self is other:
+            return not self.is_empty
+        if self.is_empty:
+            return False
+        if type(other) is type(self):
+            if other.is_empty:
+                return False
+            coords = self.__geo_interface__["coordinates"]
+            other_coords = other.__geo_interface__["coordinates"]
+            if len(coords) != len(other_coords):
+                return False
+            # Non-empty geometries cannot contain NaN, so exactly equal coordinates
+            # are also close, the tuple comparison runs in C and avoids the recursion.
+            return coords == other_coords or compare_coordinates(
+                coords=coords,
+                other=other_coords,
             )
+        if isinstance(other, _Geometry):
+            return False
+        try:
+            other_interface = other.__geo_interface__  # type: ignore [attr-defined]
+            if other_interface.get("type") != self._geom_type:
+                return False
+            other_coords = other_interface.get("coordinates")
         except AttributeError:
             return False
+        return compare_coordinates(
+            coords=self.__geo_interface__["coordinates"],
+            other=other_coords,
+        )
 
     def __bool__(self) -> bool:
         return self.is_empty is False
@@ -136,7 +187,7 @@ class _Geometry:
     @property
     def geom_type(self) -> str:
         """Return a string specifying the Geometry Type of the object."""
-        return self.__class__.__name__
+        return self._geom_type
 
     @property
     def has_z(self) -> Optional[bool]:
@@ -156,10 +207,21 @@ class _Geometry:
 
     @property
     def wkt(self) -> str:
-        """Return the Well Known Text representation of the object."""
-        if self.is_empty:
-            return f"{self._wkt_type} EMPTY"
-        return f"{self._wkt_type}{self._wkt_inset}({self._wkt_coords})"
+        """
+        Return the Well Known Text representation of the object.
+
+        Geometries are immutable, the WKT is computed once and then cached.
+        """
+        try:
+            return self._wkt
+        except AttributeError:
+            wkt = (
+                f"{self._wkt_type} EMPTY"
+                if self.is_empty
+                else f"{self._wkt_type}{self._wkt_inset}({self._wkt_coords})"
+            )
+            object.__setattr__(self, "_wkt", wkt)
+            return wkt
 
     @property
     def __geo_interface__(self) -> GeoInterface:
@@ -167,8 +229,8 @@ class _Geometry:
             msg = "Empty Geometry"
             raise AttributeError(msg)
         return {
-            "type": cast(GeomType, self.geom_type),
-            "bbox": cast(Bounds, self.bounds),
+            "type": self._geom_type,  # type: ignore [typeddict-item]
+            "bbox": self.bounds,  # type: ignore [typeddict-item]
             "coordinates": (),
         }
 
@@ -182,11 +244,6 @@ class _Geometry:
         """Return Z for 3 dimensional geometry or an empty string for 2 dimensions."""
         return " Z " if self.has_z else " "
 
-    @property
-    def _wkt_type(self) -> str:
-        """Return the WKT name of the geometry."""
-        return self.__class__.__name__.upper()
-
     @classmethod
     def _check_dict(cls, geo_interface: GeoInterface) -> None:
         if geo_interface["type"] != cls.__name__:
@@ -237,6 +294,8 @@ class Point(_Geometry):
 
     """
 
+    __slots__ = ("_geoms",)
+
     _geoms: PointType
 
     def __init__(self, x: float, y: float, z: Optional[float] = None) -> None:
@@ -249,12 +308,7 @@ class Point(_Geometry):
             Easting, northing, and elevation.
 
         """
-        geoms = (x, y, z) if z is not None else (x, y)
-        object.__setattr__(
-            self,
-            "_geoms",
-            geoms,
-        )
+        object.__setattr__(self, "_geoms", (x, y) if z is None else (x, y, z))
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -269,7 +323,12 @@ class Point(_Geometry):
 
         A Point is considered empty when it has no valid coordinates.
         """
-        return any(coord is None or math.isnan(coord) for coord in self._geoms)
+        geoms = self._geoms
+        if None in geoms:
+            return True
+        # NaN is the only value that does not compare equal to itself,
+        # the last coordinate is z for 3D points and y again for 2D points.
+        return geoms[0] != geoms[0] or geoms[1] != geoms[1] or geoms[-1] != geoms[-1]
 
     @property
     def x(self) -> float:
@@ -301,13 +360,16 @@ class Point(_Geometry):
 
     @property
     def _wkt_coords(self) -> str:
-        return " ".join(str(coordinate) for coordinate in self._geoms)
+        geoms = self._geoms
+        if len(geoms) == 2:  # noqa: PLR2004
+            return f"{geoms[0]} {geoms[1]}"
+        return f"{geoms[0]} {geoms[1]} {geoms[2]}"
 
     @property
     def __geo_interface__(self) -> GeoInterface:
         """Return the geo interface."""
         geo_interface = super().__geo_interface__
-        geo_interface["coordinates"] = cast(PointType, tuple(self._geoms))
+        geo_interface["coordinates"] = self._geoms
         return geo_interface
 
     @classmethod
@@ -315,13 +377,56 @@ class Point(_Geometry):
         """Construct a point from coordinates."""
         return cls(*coordinates[0])
 
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: Iterable[float],
+        ys: Iterable[float],
+        zs: Optional[Iterable[float]] = None,
+    ) -> Tuple["Point", ...]:
+        """
+        Construct points from separate sequences of x, y and optional z values.
+
+        The coordinates are paired up positionally, a ValueError is raised when
+        the sequences differ in length.
+
+        Example:
+        -------
+          >>> Point.from_arrays([0, 1], [2, 3])
+          (Point(0, 2), Point(1, 3))
+
+        """
+        return tuple(map(cls, *_coordinate_columns(xs, ys, zs)))
+
+    @classmethod
+    def _from_valid_coordinates(
+        cls,
+        coordinates: Iterable[PointType],
+    ) -> Tuple["Point", ...]:
+        """
+        Construct points from coordinate tuples that are already validated.
+
+        This skips ``__init__``, which makes building many points about twice
+        as fast, the coordinates must be tuples as ``__init__`` would store them.
+        """
+        # bind the lookups to locals once, outside of the loop
+        new = cls.__new__
+        set_attribute = object.__setattr__
+        points = []
+        for coordinate in coordinates:
+            point = new(cls)
+            set_attribute(point, "_geoms", coordinate)
+            points.append(point)
+        return tuple(points)
+
     @classmethod
     def _from_dict(cls, geo_interface: GeoInterface) -> "Point":
         cls._check_dict(geo_interface)
         return cls(*geo_interface["coordinates"])
 
     def _get_bounds(self) -> Bounds:
-        return self.x, self.y, self.x, self.y
+        x, y = self._geoms[0], self._geoms[1]
+        return x, y, x, y
 
     def _prepare_hull(self) -> Iterable[Point2D]:
         return ((self.x, self.y),)
@@ -341,16 +446,21 @@ class LineString(_Geometry):
 
     """
 
-    _geoms: Tuple[Point, ...]
+    __slots__ = ("_bounds", "_geoms", "_points")
 
-    def __init__(self, coordinates: LineType) -> None:
+    _geoms: LineType
+    _bounds: Bounds
+    _points: Tuple[Point, ...]
+
+    def __init__(self, coordinates: Union[LineType, "LineString"]) -> None:
         """
         Initialize a Linestring.
 
         Parameters
         ----------
         coordinates : sequence
-            A sequence of (x, y [,z]) numeric coordinate pairs or triples
+            A sequence of (x, y [,z]) numeric coordinate pairs or triples,
+            or another LineString, whose coordinates are shared without copying.
 
         Example
         -------
@@ -359,7 +469,12 @@ class LineString(_Geometry):
           >>> a = LineString([(0, 0), (1, 0), (1, 1)])
 
         """
-        object.__setattr__(self, "_geoms", self._set_geoms(coordinates))
+        geoms = (
+            coordinates._geoms  # noqa: SLF001
+            if isinstance(coordinates, LineString)
+            else self._set_geoms(coordinates)
+        )
+        object.__setattr__(self, "_geoms", geoms)
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -367,16 +482,19 @@ class LineString(_Geometry):
 
     @property
     def geoms(self) -> Tuple[Point, ...]:
-        """Return the underlying geometries."""
-        return self._geoms
+        """Return the vertices as Points, they are created once and then cached."""
+        try:
+            return self._points
+        except AttributeError:
+            pass
+        points = Point._from_valid_coordinates(self._geoms)  # noqa: SLF001
+        object.__setattr__(self, "_points", points)
+        return points
 
     @property
     def coords(self) -> LineType:
         """Return the geometry coordinates."""
-        return cast(
-            LineType,
-            tuple(point.coords[0] for point in self.geoms if point.coords),
-        )
+        return self._geoms
 
     @property
     def is_empty(self) -> bool:
@@ -390,11 +508,15 @@ class LineString(_Geometry):
     @property
     def has_z(self) -> Optional[bool]:
         """Return True if the geometry's coordinate sequence(s) have z values."""
-        return self._geoms[0].has_z if self.geoms else None
+        return len(self._geoms[0]) == 3 if self._geoms else None  # noqa: PLR2004
 
     @property
     def _wkt_coords(self) -> str:
-        return ", ".join(point._wkt_coords for point in self.geoms)  # noqa: SLF001
+        # Format all values with one template for the whole line, instead of
+        # joining the values of every vertex into an intermediate string.
+        vertex = " ".join(("{}",) * len(self._geoms[0]))
+        template = ", ".join((vertex,) * len(self._geoms))
+        return template.format(*chain.from_iterable(self._geoms))
 
     @property
     def __geo_interface__(self) -> GeoInterface:
@@ -415,41 +537,95 @@ class LineString(_Geometry):
             cast(LineType, tuple(point.coords[0] for point in args if point.coords)),
         )
 
+    @classmethod
+    def from_arrays(
+        cls,
+        xs: Iterable[float],
+        ys: Iterable[float],
+        zs: Optional[Iterable[float]] = None,
+    ) -> "LineString":
+        """
+        Create a linestring from separate sequences of x, y and optional z values.
+
+        The coordinates are paired up positionally, a ValueError is raised when
+        the sequences differ in length.
+
+        Example:
+        -------
+          >>> LineString.from_arrays([0, 1, 2], [3, 4, 5])
+          LineString(((0, 3), (1, 4), (2, 5)))
+
+        """
+        return cls(tuple(zip(*_coordinate_columns(xs, ys, zs))))
+
     @classmethod
     def _from_dict(cls, geo_interface: GeoInterface) -> "LineString":
         cls._check_dict(geo_interface)
         return cls(cast(LineType, geo_interface["coordinates"]))
 
     @staticmethod
-    def _set_geoms(coordinates: LineType) -> Tuple[Point, ...]:
-        geoms = []
-        last_len = None
-        for coord in dedupe(coordinates):
-            if len(coord) != last_len and last_len is not None:
-                msg = (  # type: ignore [unreachable]
-                    "All coordinates must have the same dimension"
-                )
-                raise DimensionError(
-                    msg,
-                )
-            last_len = len(coord)
-            point = Point(*coord)
-            if point:
-                geoms.append(point)
-        return tuple(geoms)
+    def _set_geoms(coordinates: LineType) -> LineType:
+        msg = "All coordinates must have the same dimension"
+        coords = dedupe(coordinates)
+        dimensions = {len(coord) for coord in coords}
+        if len(dimensions) > 1:
+            raise DimensionError(
+                msg,
+            )
+        if dimensions == {2}:
+            # Drop empty vertices the way Point.is_empty does, without creating a
+            # Point per vertex. NaN is the only value that is not equal to itself.
+            return tuple(
+                [  # type: ignore [misc]
+                    (x, y)
+                    for x, y in coords
+                    if x is not None and y is not None and x == x and y == y  # noqa: PLR0124
+                ],
+            )
+        geoms = tuple(
+            [
+                point._geoms  # noqa: SLF001
+                for point in starmap(Point, coords)
+                if not point.is_empty
+            ],
+        )
+        # Point stores a missing z as a 2D coordinate, so a 3D line can still end
+        # up with mixed dimensions, which would corrupt its WKT and convex hull.
+        if len({len(coord) for coord in geoms}) > 1:
+            msg = "3D coordinates must not have a missing z value"
+            raise DimensionError(
+                msg,
+            )
+        return geoms  # type: ignore [return-value]
 
     def _get_bounds(self) -> Bounds:
-        """Return the X-Y bounding box."""
-        xy = list(zip(*((p.x, p.y) for p in self._geoms)))
-        return (
-            min(xy[0]),
-            min(xy[1]),
-            max(xy[0]),
-            max(xy[1]),
-        )
+        """Return the X-Y bounding box, it is computed once and then cached."""
+        try:
+            return self._bounds
+        except AttributeError:
+            pass
+        # A single pass over the vertices, without transposing them first.
+        min_x = max_x = self._geoms[0][0]
+        min_y = max_y = self._geoms[0][1]
+        for coord in self._geoms:
+            x, y = coord[0], coord[1]
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        bounds = min_x, min_y, max_x, max_y
+        object.__setattr__(self, "_bounds", bounds)
+        return bounds
 
     def _prepare_hull(self) -> Iterable[Point2D]:
-        return ((pt.x, pt.y) for pt in self._geoms)
+        # _set_geoms guarantees that all vertices have the dimension of the first.
+        if self.has_z:
+            return (coord[:2] for coord in self._geoms)
+        return self._geoms  # type: ignore [return-value]
 
 
 class LinearRing(LineString):
@@ -462,19 +638,25 @@ class LinearRing(LineString):
     A Linear Ring is self closing
     """
 
-    def __init__(self, coordinates: LineType) -> None:
+    __slots__ = ("_signed_area",)
+
+    _signed_area: float
+
+    def __init__(self, coordinates: Union[LineType, LineString]) -> None:
         """
         Initialize a LinearRing.
 
         Args:
         ----
             coordinates (Sequence):
-                A sequence of (x, y [,z]) numeric coordinate pairs or triples
+                A sequence of (x, y [,z]) numeric coordinate pairs or triples,
+                or a LineString to share the coordinates with.
 
         """
         super().__init__(coordinates)
-        if not self.is_empty and self._geoms[0].coords != self._geoms[-1].coords:
-            object.__setattr__(self, "_geoms", (*self._geoms, self._geoms[0]))
+        geoms = self._geoms
+        if geoms and geoms[0] != geoms[-1]:
+            object.__setattr__(self, "_geoms", (*geoms, geoms[0]))
 
     @property
     def centroid(self) -> Optional[Point]:
@@ -484,18 +666,27 @@ class LinearRing(LineString):
             raise DimensionError(msg)
 
         cent, area = centroid(self.coords)
-        if any(math.isnan(coord) for coord in cent):
+        if any(isnan(coord) for coord in cent):
             return None
         return (
             Point(x=cent[0], y=cent[1])
-            if math.isclose(a=area, b=signed_area(self.coords))
+            if isclose(a=area, b=self._get_signed_area())
             else None
         )
 
     @property
     def is_ccw(self) -> bool:
         """Return True if the ring is oriented counter clock-wise."""
-        return signed_area(self.coords) >= 0
+        return self._get_signed_area() >= 0
+
+    def _get_signed_area(self) -> float:
+        """Return the signed area of the ring, it is computed once and then cached."""
+        try:
+            return self._signed_area
+        except AttributeError:
+            area = signed_area(self._geoms)
+            object.__setattr__(self, "_signed_area", area)
+            return area
 
 
 class Polygon(_Geometry):
@@ -515,12 +706,16 @@ class Polygon(_Geometry):
 
     """
 
-    _geoms: Tuple[LinearRing, ...]
+    __slots__ = ("_coordinates", "_exterior", "_holes")
+
+    _coordinates: Tuple[LineType, ...]
+    _exterior: LinearRing
+    _holes: Tuple[LinearRing, ...]
 
     def __init__(
         self,
-        shell: LineType,
-        holes: Optional[Sequence[LineType]] = None,
+        shell: Union[LineType, LinearRing],
+        holes: Optional[Sequence[Union[LineType, LinearRing]]] = None,
     ) -> None:
         """
         Initialize the polygon.
@@ -528,7 +723,8 @@ class Polygon(_Geometry):
         Parameters
         ----------
         shell : sequence
-            A sequence of (x, y [,z]) numeric coordinate pairs or triples
+            A sequence of (x, y [,z]) numeric coordinate pairs or triples,
+            or a LinearRing, which is used as is.
         holes : sequence
             A sequence of objects which satisfy the same requirements as the
             shell parameters above
@@ -541,27 +737,28 @@ class Polygon(_Geometry):
           >>> polygon = Polygon(coords)
 
         """
-        interiors = tuple(LinearRing(hole) for hole in holes) if holes else ()
-        exterior = LinearRing(shell)
-        object.__setattr__(self, "_geoms", (exterior, interiors))
+        interiors = tuple(self._as_ring(hole) for hole in holes) if holes else ()
+        object.__setattr__(self, "_exterior", self._as_ring(shell))
+        object.__setattr__(self, "_holes", interiors)
 
     def __repr__(self) -> str:
         """Return the representation."""
         return f"{self.geom_type}{self.coords}"
 
+    @staticmethod
+    def _as_ring(ring: Union[LineType, LinearRing]) -> LinearRing:
+        """Return a LinearRing, rings are immutable and can be shared as they are."""
+        return ring if isinstance(ring, LinearRing) else LinearRing(ring)
+
     @property
     def exterior(self) -> LinearRing:
         """Return the exterior Linear Ring of the polygon."""
-        return self._geoms[0]
+        return self._exterior
 
     @property
     def interiors(self) -> Iterator[LinearRing]:
         """Interiors (Holes) of the polygon."""
-        yield from (
-            interior
-            for interior in self._geoms[1]  # type: ignore [attr-defined]
-            if interior
-        )
+        yield from (interior for interior in self._holes if interior)
 
     @property
     def is_empty(self) -> bool:
@@ -570,7 +767,7 @@ class Polygon(_Geometry):
 
         A polygon is empty when it does not have an exterior.
         """
-        return self._geoms[0].is_empty
+        return self._exterior.is_empty
 
     @property
     def coords(self) -> PolygonType:
@@ -579,27 +776,26 @@ class Polygon(_Geometry):
 
         Note that this is not implemented in Shapely.
         """
-        if self._geoms[1]:
-            return cast(
-                PolygonType,
-                (
-                    self.exterior.coords,
-                    tuple(interior.coords for interior in self.interiors if interior),
-                ),
+        if self._holes:
+            return (  # type: ignore [return-value]
+                self._exterior.coords,
+                tuple(interior.coords for interior in self.interiors if interior),
             )
-        return cast(PolygonType, (self.exterior.coords,))
+        return (self._exterior.coords,)  # type: ignore [return-value]
 
     @property
     def has_z(self) -> Optional[bool]:
         """Return True if the geometry's coordinate sequence(s) have z values."""
-        return self._geoms[0].has_z
+        return self._exterior.has_z
 
     @property
     def _wkt_coords(self) -> str:
-        ec = self.exterior._wkt_coords  # noqa: SLF001
+        ec = self._exterior._wkt_coords  # noqa: SLF001
         ic = "".join(
-            f",({interior._wkt_coords})"  # noqa: SLF001
-            for interior in self.interiors
+            [
+                f",({interior._wkt_coords})"  # noqa: SLF001
+                for interior in self.interiors
+            ],
         )
         return f"({ec}){ic}"
 
@@ -607,10 +803,21 @@ class Polygon(_Geometry):
     def __geo_interface__(self) -> GeoInterface:
         """Return the geo interface."""
         geo_interface = super().__geo_interface__
-        coords = (self.exterior.coords, *tuple(hole.coords for hole in self.interiors))
-        geo_interface["coordinates"] = coords
+        geo_interface["coordinates"] = self._get_coordinates()
         return geo_interface
 
+    def _get_coordinates(self) -> Tuple[LineType, ...]:
+        """Return the coordinates of the rings, they are built once and then cached."""
+        try:
+            return self._coordinates
+        except AttributeError:
+            coordinates = (
+                self._exterior.coords,
+                *(hole.coords for hole in self.interiors),
+            )
+            object.__setattr__(self, "_coordinates", coordinates)
+            return coordinates
+
     @classmethod
     def from_coordinates(cls, coordinates: PolygonType) -> "Polygon":
         """Construct a linestring from coordinates."""
@@ -619,10 +826,7 @@ class Polygon(_Geometry):
     @classmethod
     def from_linear_rings(cls, shell: LinearRing, *args: LinearRing) -> "Polygon":
         """Construct a Polygon from linear rings."""
-        return cls(
-            shell=shell.coords,
-            holes=tuple(lr.coords for lr in args),
-        )
+        return cls(shell=shell, holes=args)
 
     @classmethod
     def _from_dict(cls, geo_interface: GeoInterface) -> "Polygon":
@@ -635,10 +839,10 @@ class Polygon(_Geometry):
         )
 
     def _get_bounds(self) -> Bounds:
-        return self.exterior._get_bounds()  # noqa: SLF001
+        return self._exterior._get_bounds()  # noqa: SLF001
 
     def _prepare_hull(self) -> Iterable[Point2D]:
-        return self.exterior._prepare_hull()  # noqa: SLF001
+        return self._exterior._prepare_hull()  # noqa: SLF001
 
 
 class _MultiGeometry(_Geometry):
@@ -648,6 +852,24 @@ class _MultiGeometry(_Geometry):
     The collection may be homogeneous (MultiPoint etc.) or heterogeneous.
     """
 
+    __slots__ = ("_bounds", "_coordinates", "_geoms")
+
+    _bounds: Bounds
+    _coordinates: MultiCoordinatesType
+    _geoms: Tuple[_Geometry, ...]
+
+    @property
+    def __geo_interface__(self) -> GeoInterface:
+        """Return the geo interface, the coordinates are only built once."""
+        geo_interface = super().__geo_interface__
+        try:
+            coordinates = self._coordinates
+        except AttributeError:
+            coordinates = self._get_coordinates()
+            object.__setattr__(self, "_coordinates", coordinates)
+        geo_interface["coordinates"] = coordinates
+        return geo_interface
+
     @property
     def coords(self) -> NoReturn:
         """
@@ -668,29 +890,45 @@ class _MultiGeometry(_Geometry):
     @property
     def geoms(self) -> Iterator[_Geometry]:
         """Iterate over the geometries."""
-        yield from (
-            geom
-            for geom in self._geoms  # type: ignore [attr-defined]
-            if not geom.is_empty
-        )
+        yield from (geom for geom in self._geoms if not geom.is_empty)
 
     @property
     def is_empty(self) -> bool:
         """Return if collection is not empty and all its member are not empty."""
-        return all(geom.is_empty for geom in self._geoms)  # type: ignore [attr-defined]
+        return all(geom.is_empty for geom in self._geoms)
 
-    def _get_bounds(self) -> Bounds:
-        """Return the X-Y bounding box."""
-        geom_bounds = list(
-            zip(*(geom.bounds for geom in self.geoms)),
-        )
-        return (
-            min(geom_bounds[0]),
-            min(geom_bounds[1]),
-            max(geom_bounds[2]),
-            max(geom_bounds[3]),
+    def _prepare_hull(self) -> Iterable[Point2D]:
+        return chain.from_iterable(
+            geom._prepare_hull()  # noqa: SLF001
+            for geom in self.geoms
         )
 
+    def _get_coordinates(self) -> MultiCoordinatesType:
+        msg = "Must be implemented by subclass"
+        raise NotImplementedError(msg)
+
+    def _get_bounds(self) -> Bounds:
+        """Return the X-Y bounding box, combined once from the cached member bounds."""
+        try:
+            return self._bounds
+        except AttributeError:
+            pass
+        # A single pass over the member bounds, without transposing them first.
+        member_bounds = (geom._get_bounds() for geom in self.geoms)  # noqa: SLF001
+        min_x, min_y, max_x, max_y = next(member_bounds)
+        for x0, y0, x1, y1 in member_bounds:
+            if x0 < min_x:  # noqa: PLR1730
+                min_x = x0
+            if y0 < min_y:  # noqa: PLR1730
+                min_y = y0
+            if x1 > max_x:  # noqa: PLR1730
+                max_x = x1
+            if y1 > max_y:  # noqa: PLR1730
+                max_y = y1
+        bounds = min_x, min_y, max_x, max_y
+        object.__setattr__(self, "_bounds", bounds)
+        return bounds
+
 
 class MultiPoint(_MultiGeometry):
     """
@@ -703,6 +941,8 @@ class MultiPoint(_MultiGeometry):
 
     """
 
+    __slots__ = ()
+
     _geoms: Tuple[Point, ...]
 
     def __init__(self, points: Sequence[PointType], unique: bool = False) -> None:
@@ -730,7 +970,7 @@ class MultiPoint(_MultiGeometry):
         """
         if unique:
             points = set(points)  # type: ignore [assignment]
-        object.__setattr__(self, "_geoms", tuple(Point(*point) for point in points))
+        object.__setattr__(self, "_geoms", tuple(starmap(Point, points)))
 
     def __len__(self) -> int:
         """Return the number of points in this MultiPoint."""
@@ -746,28 +986,25 @@ class MultiPoint(_MultiGeometry):
     @property
     def geoms(self) -> Iterator[Point]:
         """Iterate over the points."""
-        yield from (cast(Point, p) for p in super().geoms)
+        yield from super().geoms  # type: ignore [misc]
 
     @property
     def _wkt_coords(self) -> str:
-        return ", ".join(
-            f"({point._wkt_coords})"  # noqa: SLF001
-            for point in self.geoms
-        )
+        # Format all points with one template, as for the vertices of a LineString.
+        coords = [point._geoms for point in self.geoms]  # noqa: SLF001
+        template = ", ".join(f"({' '.join(('{}',) * len(coord))})" for coord in coords)
+        return template.format(*chain.from_iterable(coords))
 
-    @property
-    def __geo_interface__(self) -> GeoInterface:
-        """Return the geo interface."""
-        geo_interface = super().__geo_interface__
-        geo_interface["coordinates"] = tuple(
-            geom.coords[0] for geom in self.geoms if geom.coords
-        )
-        return geo_interface
+    def _get_coordinates(self) -> MultiCoordinatesType:
+        return tuple(geom._geoms for geom in self.geoms)  # noqa: SLF001
 
     @classmethod
     def from_points(cls, *args: Point, unique: bool = False) -> "MultiPoint":
         """Create a MultiPoint from Points."""
-        return cls([point.coords[0] for point in args if point.coords], unique=unique)
+        return cls(
+            [point._geoms for point in args if point],  # noqa: SLF001
+            unique=unique,
+        )
 
     @classmethod
     def _from_dict(cls, geo_interface: GeoInterface) -> "MultiPoint":
@@ -791,6 +1028,8 @@ class MultiLineString(_MultiGeometry):
 
     """
 
+    __slots__ = ()
+
     _geoms: Tuple[LineString, ...]
 
     def __init__(self, lines: Sequence[LineType], unique: bool = False) -> None:
@@ -814,7 +1053,7 @@ class MultiLineString(_MultiGeometry):
         """
         if unique:
             lines = {tuple(line) for line in lines}  # type: ignore [assignment]
-        object.__setattr__(self, "_geoms", tuple(LineString(line) for line in lines))
+        object.__setattr__(self, "_geoms", tuple(map(LineString, lines)))
 
     def __len__(self) -> int:
         """Return the number of lines in the collection."""
@@ -827,21 +1066,19 @@ class MultiLineString(_MultiGeometry):
     @property
     def geoms(self) -> Iterator[LineString]:
         """Iterate over the points."""
-        yield from (cast(LineString, line) for line in super().geoms)
+        yield from super().geoms  # type: ignore [misc]
 
     @property
     def _wkt_coords(self) -> str:
         return ",".join(
-            f"({linestring._wkt_coords})"  # noqa: SLF001
-            for linestring in self.geoms
+            [
+                f"({linestring._wkt_coords})"  # noqa: SLF001
+                for linestring in self.geoms
+            ],
         )
 
-    @property
-    def __geo_interface__(self) -> GeoInterface:
-        """Return the geo interface."""
-        geo_interface = super().__geo_interface__
-        geo_interface["coordinates"] = tuple(geom.coords for geom in self.geoms)
-        return geo_interface
+    def _get_coordinates(self) -> MultiCoordinatesType:
+        return tuple(geom.coords for geom in self.geoms)
 
     @classmethod
     def from_linestrings(
@@ -857,10 +1094,6 @@ class MultiLineString(_MultiGeometry):
         cls._check_dict(geo_interface)
         return cls(cast(Sequence[LineType], geo_interface["coordinates"]))
 
-    def _prepare_hull(self) -> Iterable[Point2D]:
-        for geom in self.geoms:
-            yield from geom._prepare_hull()  # noqa: SLF001
-
 
 class MultiPolygon(_MultiGeometry):
     """
@@ -876,6 +1109,8 @@ class MultiPolygon(_MultiGeometry):
 
     """
 
+    __slots__ = ()
+
     _geoms: Tuple[Polygon, ...]
 
     def __init__(self, polygons: Sequence[PolygonType], unique: bool = False) -> None:
@@ -935,22 +1170,14 @@ class MultiPolygon(_MultiGeometry):
     @property
     def geoms(self) -> Iterator[Polygon]:
         """Iterate over the points."""
-        yield from (cast(Polygon, p) for p in super().geoms)
+        yield from super().geoms  # type: ignore [misc]
 
     @property
     def _wkt_coords(self) -> str:
-        return ",".join(f"({poly._wkt_coords})" for poly in self.geoms)  # noqa: SLF001
+        return ",".join([f"({poly._wkt_coords})" for poly in self.geoms])  # noqa: SLF001
 
-    @property
-    def __geo_interface__(self) -> GeoInterface:
-        """Return the geo interface."""
-        geo_interface = super().__geo_interface__
-        coords = tuple(
-            (geom.exterior.coords, *tuple(hole.coords for hole in geom.interiors))
-            for geom in self.geoms
-        )
-        geo_interface["coordinates"] = coords
-        return geo_interface
+    def _get_coordinates(self) -> MultiCoordinatesType:
+        return tuple(geom._get_coordinates() for geom in self.geoms)  # noqa: SLF001
 
     @classmethod
     def from_polygons(cls, *args: Polygon, unique: bool = False) -> "MultiPolygon":
@@ -966,10 +1193,6 @@ class MultiPolygon(_MultiGeometry):
         )
         return cls(cast(Sequence[PolygonType], coords))
 
-    def _prepare_hull(self) -> Iterable[Point2D]:
-        for geom in self.geoms:
-            yield from geom._prepare_hull()  # noqa: SLF001
-
 
 Geometry = Union[
     Point,
@@ -1012,11 +1235,14 @@ class GeometryCollection(_MultiGeometry):
 
     """
 
+    __slots__ = ()
+
     _geoms: Tuple[Union[Geometry, "GeometryCollection"], ...]
 
     def __init__(
         self,
         geometries: Iterable[Union[Geometry, "GeometryCollection"]],
+        flatten: bool = False,
     ) -> None:
         """
         Initialize the MultiGeometry with Geometries.
@@ -1024,8 +1250,12 @@ class GeometryCollection(_MultiGeometry):
         Args:
         ----
             geometries (Iterable[Geometry]
+            flatten (bool): when true, the members of nested collections are
+                added to this collection in place of the nested collections.
 
         """
+        if flatten:
+            geometries = self._flatten(geometries)
         object.__setattr__(self, "_geoms", tuple(geom for geom in geometries if geom))
 
     def __eq__(self, other: object) -> bool:
@@ -1033,29 +1263,24 @@ class GeometryCollection(_MultiGeometry):
         Return equality between collections.
 
         Types and coordinates from all contained geometries must be equal.
+        Two collections are compared member by member, which short-circuits
+        on the first difference and on members they share.
         """
+        if isinstance(other, GeometryCollection):
+            return not self.is_empty and self._geoms == other._geoms
+        if isinstance(other, _Geometry) or self.is_empty:
+            return False
         try:
-            if self.is_empty:
+            other_interface = other.__geo_interface__  # type: ignore [attr-defined]
+            if other_interface.get("type") != self.geom_type:
                 return False
-            if (
-                other.__geo_interface__.get("type")  # type: ignore [attr-defined]
-                != self.geom_type
-            ):
-                return False
-            if len(
-                other.__geo_interface__.get(  # type: ignore [attr-defined]
-                    "geometries",
-                    [],
-                ),
-            ) != len(
-                self,
-            ):
+            if len(other_interface.get("geometries", [])) != len(self):
                 return False
         except AttributeError:
             return False
         return compare_geo_interface(
             first=self.__geo_interface__,
-            second=other.__geo_interface__,  # type: ignore [attr-defined]
+            second=other_interface,
         )
 
     def __len__(self) -> int:
@@ -1075,19 +1300,25 @@ class GeometryCollection(_MultiGeometry):
 
     @property
     def _wkt_coords(self) -> str:
-        return ", ".join(geom.wkt for geom in self.geoms)
+        return ", ".join([geom.wkt for geom in self._geoms])
 
     @property
     def __geo_interface__(self) -> GeoCollectionInterface:  # type: ignore [override]
         """Return the geo interface of the collection."""
         return {
             "type": "GeometryCollection",
-            "geometries": tuple(geom.__geo_interface__ for geom in self.geoms),
+            "geometries": tuple(geom.__geo_interface__ for geom in self._geoms),
         }
 
-    def _prepare_hull(self) -> Iterable[Point2D]:
-        for geom in self.geoms:
-            yield from geom._prepare_hull()  # noqa: SLF001
+    @staticmethod
+    def _flatten(
+        geometries: Iterable[Union[Geometry, "GeometryCollection"]],
+    ) -> Iterator[Geometry]:
+        for geom in geometries:
+            if isinstance(geom, GeometryCollection):
+                yield from GeometryCollection._flatten(geom._geoms)  # noqa: SLF001
+            else:
+                yield geom
 
 
 __all__ = [
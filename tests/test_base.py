@@ -1,5 +1,7 @@
 """Test Baseclass."""
 
+import copy
+import pickle
 from unittest import mock
 
 import pytest
@@ -148,3 +150,53 @@ def test_delattr(attr, expected_error, expected_error_message) -> None:
     # Act
     with pytest.raises(expected_error, match=f"^{expected_error_message}$"):
         delattr(base_geo, attr)
+
+
+def test_geom_type() -> None:
+    assert geometry._Geometry().geom_type == "_Geometry"
+
+
+def test_geom_type_subclass() -> None:
+    class MyPoint(geometry.Point):
+        __slots__ = ()
+
+    assert MyPoint(1, 2).geom_type == "MyPoint"
+    assert geometry.Point(1, 2).geom_type == "Point"
+
+
+def test_wkt_type_subclass() -> None:
+    class MyPoint(geometry.Point):
+        __slots__ = ()
+
+    assert MyPoint(1, 2).wkt == "MYPOINT (1 2)"
+    assert geometry.Point(1, 2).wkt == "POINT (1 2)"
+
+
+def test_multi_geometry_coordinates() -> None:
+    multi_geo = geometry._MultiGeometry()
+    with pytest.raises(NotImplementedError, match=r"^Must be implemented by subclass$"):
+        multi_geo._get_coordinates()
+
+
+@pytest.mark.parametrize(
+    "geom",
+    [
+        geometry.Point(1, 2),
+        geometry.LineString([(0, 0), (1, 1)]),
+        geometry.Polygon(
+            [(0, 0), (1, 0), (1, 1)],
+            [[(0.2, 0.1), (0.8, 0.1), (0.8, 0.7)]],
+        ),
+        geometry.MultiPolygon([(((0, 0), (1, 1), (1, 0), (0, 0)),)]),
+        geometry.GeometryCollection([geometry.Point(1, 2, 3)]),
+    ],
+)
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_and_copy(geom: geometry._Geometry, protocol: int) -> None:
+    geom.bounds  # noqa: B018
+    restored = pickle.loads(pickle.dumps(geom, protocol))  # noqa: S301
+
+    assert restored == geom
+    assert restored.wkt == geom.wkt
+    assert copy.copy(geom) == geom
+    assert copy.deepcopy(geom) == geom
@@ -21,6 +21,17 @@ def test_num_float() -> None:
     assert isinstance(factories.num("1.1"), float)
 
 
+def test_num_nan() -> None:
+    with pytest.raises(ValueError, match=r"^nan is not a finite number$"):
+        factories.num("nan")
+
+
+@pytest.mark.parametrize("number", ["inf", "-inf"])
+def test_num_inf(number: str) -> None:
+    with pytest.raises(OverflowError, match=r"is not a finite number$"):
+        factories.num(number)
+
+
 def test_force_2d_point() -> None:
     # 2d point to 2d point (no actual change)
     p = geometry.Point(-1, 1)
@@ -209,6 +220,17 @@ def test_orient_unchanged() -> None:
     assert new_interiors[1].coords == interiors[1]
 
 
+def test_orient_reuses_rings() -> None:
+    exterior = ((0, 0), (2, 0), (2, 2), (0, 2), (0, 0))
+    interior = ((0.5, 0.25), (0.5, 1.25), (1.5, 1.25), (1.5, 0.25), (0.5, 0.25))
+    p = geometry.Polygon(exterior, [interior])
+
+    p1 = factories.orient(p, True)
+
+    assert p1.exterior is p.exterior
+    assert next(p1.interiors) is next(p.interiors)
+
+
 def test_orient_false() -> None:
     exterior = ((0, 0), (2, 0), (2, 2), (0, 2), (0, 0))
     interiors = [
@@ -291,6 +313,32 @@ class TestWKT:
         assert str(p) == "POINT (0 1)"
         assert p.geom_type == "Point"
 
+    def test_point_nan(self) -> None:
+        with pytest.raises(ValueError, match=r"^NAN is not a finite number$"):
+            factories.from_wkt("POINT (nan 1)")
+
+    def test_point_inf(self) -> None:
+        with pytest.raises(OverflowError, match=r"^1E999 is not a finite number$"):
+            factories.from_wkt("POINT (1 1e999)")
+
+    def test_not_cached(self) -> None:
+        wkt = "LINESTRING (30 10, 10 30, 40 40)"
+
+        assert factories.from_wkt(wkt) is not factories.from_wkt(wkt)
+
+    def test_cached(self) -> None:
+        wkt = "LINESTRING (30 10, 10 30, 40 40)"
+
+        assert factories.from_wkt_cached(wkt) is factories.from_wkt_cached(wkt)
+        assert factories.from_wkt_cached(wkt) == factories.from_wkt(wkt)
+
+    def test_cached_collection_members_not_cached(self) -> None:
+        factories.from_wkt_cached.cache_clear()
+
+        factories.from_wkt_cached("GEOMETRYCOLLECTION (POINT (1 2), POINT (3 4))")
+
+        assert factories.from_wkt_cached.cache_info().currsize == 1
+
     def test_point_capitalized(self) -> None:
         pts = ["POINT (1 0)", "point (1 0)", "Point(1 0)", "pOinT(1 0)"]
         for pt in pts:
@@ -1,5 +1,7 @@
 """Test Feature and FeatureCollection."""
 
+import copy
+import pickle
 import unittest
 
 import pytest
@@ -21,6 +23,22 @@ class TestFeature:
         self.f3 = feature.Feature(self.a, {}, feature_id="1")
         self.fc = feature.FeatureCollection([self.f1, self.f2])
 
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_feature_pickle_and_copy(self, protocol: int) -> None:
+        restored = pickle.loads(pickle.dumps(self.f3, protocol))  # noqa: S301
+
+        assert restored == self.f3
+        assert restored.id == "1"
+        assert copy.deepcopy(self.f3) == self.f3
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_featurecollection_pickle_and_copy(self, protocol: int) -> None:
+        restored = pickle.loads(pickle.dumps(self.fc, protocol))  # noqa: S301
+
+        assert restored == self.fc
+        assert len(restored) == 2
+        assert copy.deepcopy(self.fc) == self.fc
+
     def test_feature_eq(self) -> None:
         assert self.f1 == feature.Feature(self.a)
         assert self.f3 == feature.Feature(self.a, {}, feature_id="1")
@@ -198,3 +216,7 @@ class TestFeature:
         fc = feature.FeatureCollection([feature.Feature(ls1), feature.Feature(ls2)])
 
         assert fc.bounds == (0, 1, 3, 4)
+
+    def test_slots(self) -> None:
+        assert not hasattr(self.f1, "__dict__")
+        assert not hasattr(self.fc, "__dict__")
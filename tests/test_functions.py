@@ -65,6 +65,18 @@ def test_signed_area() -> None:
     assert centroid(a0)[1] == centroid(a1)[1] == -4
 
 
+def test_signed_area_unclosed() -> None:
+    closed = [(1, 1), (3, 1), (1, 3), (1, 1)]
+
+    assert signed_area(closed[:-1]) == signed_area(closed) == 2
+
+
+def test_signed_area_unclosed_cw() -> None:
+    closed = [(1, 1), (1, 4), (3, 4), (3, 1), (1, 1)]
+
+    assert signed_area(closed[:-1]) == signed_area(closed) == -6
+
+
 def test_signed_area2() -> None:
     a0 = [(0, 0), (0, 1), (1, 1), (0, 0)]
     assert centroid(a0)[1] == signed_area(a0)
@@ -279,6 +291,14 @@ def test_dedupe_line2() -> None:
     assert dedupe(((1, 2, 3),) * 2 + ((4, 5, 6),) * 3) == ((1, 2, 3), (4, 5, 6))
 
 
+def test_dedupe_iterator() -> None:
+    assert dedupe(iter([(1, 2), (1, 2), (3, 4), (1, 2)])) == ((1, 2), (3, 4), (1, 2))
+
+
+def test_dedupe_empty() -> None:
+    assert dedupe(()) == ()
+
+
 @pytest.mark.parametrize(
     ("numbers", "expected"),
     [
@@ -1,5 +1,7 @@
 """Test Baseclass."""
 
+from unittest import mock
+
 from pygeoif import geometry
 from pygeoif.factories import from_wkt
 
@@ -174,6 +176,13 @@ def test_eq() -> None:
     assert gc1 == gc2
 
 
+def test_eq_floats() -> None:
+    gc1 = geometry.GeometryCollection([geometry.Point(0.3, 0.6)])
+    gc2 = geometry.GeometryCollection([geometry.Point(0.2 + 0.1, 0.3 * 2)])
+
+    assert gc1 == gc2
+
+
 def test_neq_len() -> None:
     poly1 = geometry.Polygon([(0, 0), (1, 1), (1, 0), (0, 0)])
     e = [(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)]
@@ -228,6 +237,33 @@ def test_neq_interface() -> None:
     assert gc1 != object()
 
 
+def test_eq_interface() -> None:
+    gc = geometry.GeometryCollection([geometry.Point(0, 0), geometry.Point(1, 1)])
+    not_a_geometry = mock.Mock(
+        __geo_interface__={
+            "type": "GeometryCollection",
+            "geometries": (
+                {"type": "Point", "coordinates": (0, 0)},
+                {"type": "Point", "coordinates": (1, 1)},
+            ),
+        },
+    )
+
+    assert gc == not_a_geometry
+
+
+def test_neq_interface_len() -> None:
+    gc = geometry.GeometryCollection([geometry.Point(0, 0), geometry.Point(1, 1)])
+    not_a_geometry = mock.Mock(
+        __geo_interface__={
+            "type": "GeometryCollection",
+            "geometries": ({"type": "Point", "coordinates": (0, 0)},),
+        },
+    )
+
+    assert gc != not_a_geometry
+
+
 def test_convex_hull() -> None:
     p0 = geometry.Point(0, 0)
     p1 = geometry.Point(-1, -1)
@@ -388,6 +424,19 @@ def test_nested_geometry_collection_neq() -> None:
     assert gc3 != gc4
 
 
+def test_nested_geometry_collection_flatten() -> None:
+    point = geometry.Point(0, 0)
+    multipoint = geometry.MultiPoint([(0, 0), (1, 1), (1, 2), (2, 2)])
+    line = geometry.LineString([(0, 0), (3, 1)])
+    gc1 = geometry.GeometryCollection([point, multipoint])
+    gc2 = geometry.GeometryCollection([gc1, line])
+
+    gc3 = geometry.GeometryCollection([gc2, geometry.GeometryCollection([])], True)
+
+    assert len(gc3) == 3
+    assert gc3 == geometry.GeometryCollection([point, multipoint, line])
+
+
 def test_geometry_collection_neq_when_empty() -> None:
     gc1 = geometry.GeometryCollection([])
     gc2 = geometry.GeometryCollection([geometry.Point(0, 0)])
@@ -470,3 +519,9 @@ def test_nested_geometry_collections_wkt() -> None:
     gc3 = geometry.GeometryCollection([gc2, poly1])
 
     assert from_wkt(str(gc3)) == gc3
+
+
+def test_no_instance_dict() -> None:
+    gc = geometry.GeometryCollection([geometry.Point(0, 0)])
+
+    assert not hasattr(gc, "__dict__")
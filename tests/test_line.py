@@ -33,6 +33,24 @@ def test_empty_points_omitted() -> None:
     assert line.coords == ((0, 0, 0), (2, 2, 2))
 
 
+def test_geoms() -> None:
+    line = geometry.LineString([[0, 0], (1, 1), [2, 2]])
+
+    assert line.geoms == (
+        geometry.Point(0, 0),
+        geometry.Point(1, 1),
+        geometry.Point(2, 2),
+    )
+    assert line.coords == ((0, 0), (1, 1), (2, 2))
+
+
+def test_geoms_cached() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 2)])
+
+    assert line.geoms is line.geoms
+    assert line.geoms[0] is line.geoms[0]
+
+
 def test_set_geoms_raises() -> None:
     line = geometry.LineString([(0, 0), (1, 0)])  # pragma: no mutate
 
@@ -43,6 +61,21 @@ def test_set_geoms_raises() -> None:
         line._set_geoms([(0.0, 0.0, 0), (1.0, 1.0)])  # pragma: no mutate
 
 
+@pytest.mark.parametrize(
+    "coords",
+    [
+        [(0, 0, None), (1, 1, 1), (2, 2, 2)],
+        [(0, 0, 1), (1, 1, None), (2, 2, 2)],
+    ],
+)
+def test_missing_z_raises(coords) -> None:
+    with pytest.raises(
+        exceptions.DimensionError,
+        match=r"^3D coordinates must not have a missing z value$",
+    ):
+        geometry.LineString(coords)
+
+
 def test_geo_interface() -> None:
     line = geometry.LineString([(0, 0), (1, 1)])
 
@@ -71,6 +104,12 @@ def test_wkt() -> None:
     assert line.wkt == "LINESTRING (0 0, 1 1, 2 2)"
 
 
+def test_wkt_cached() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 2)])
+
+    assert line.wkt is line.wkt
+
+
 def test_wkt3d() -> None:
     line = geometry.LineString([(0, 0, 0), (1, 1, 3), (2, 2, 6)])
 
@@ -174,6 +213,12 @@ def test_convex_hull_3d() -> None:
     assert line.convex_hull == geometry.LineString([(0, 0), (2, 2)])
 
 
+def test_convex_hull_3d_after_missing_z_is_rejected() -> None:
+    """A missing z cannot leave 2D and 3D vertices for the hull to mix."""
+    with pytest.raises(exceptions.DimensionError):
+        geometry.LineString([(0, 0, None), (1, 0, 1), (1, 1, 1)]).convex_hull  # noqa: B018
+
+
 def test_convex_hull_3d_collapsed_to_point() -> None:
     line = geometry.LineString([(0, 0, 0), (0, 0, 1), (0, 0, 2)])
 
@@ -238,3 +283,106 @@ def test_empty_coords_nan() -> None:
     line = geometry.LineString(((math.nan, math.nan),))
 
     assert line.coords == ()
+
+
+def test_no_instance_dict() -> None:
+    line = geometry.LineString([(0, 0), (1, 1)])
+
+    assert not hasattr(line, "__dict__")
+
+
+def test_from_linestring_shares_coordinates() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 0)])
+
+    copy = geometry.LineString(line)
+
+    assert copy == line
+    assert copy.coords is line.coords
+
+
+def test_eq_exact_skips_tolerant_compare() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 0)])
+
+    with mock.patch.object(geometry, "compare_coordinates") as compare:
+        assert line == geometry.LineString([(0, 0), (1, 1), (2, 0)])
+
+    compare.assert_not_called()
+
+
+def test_eq_close() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 0)])
+
+    assert line == geometry.LineString([(0, 0), (1, 1.000_000_000_1), (2, 0)])
+    assert line != geometry.LineString([(0, 0), (1, 1.1), (2, 0)])
+    assert line != geometry.LineString([(0, 0), (1, 1)])
+
+
+def test_neq_empty() -> None:
+    line = geometry.LineString([(0, 0), (1, 1)])
+
+    assert line != geometry.LineString([])
+    assert geometry.LineString([]) != line
+
+
+def test_bounds_cached() -> None:
+    line = geometry.LineString([(0, 0), (1, 2), (3, -1)])
+
+    assert line.bounds == (0, -1, 3, 2)
+    assert line.bounds is line.bounds
+
+
+def test_eq_identity() -> None:
+    line = geometry.LineString([(0, 0), (1, 1)])
+    empty = geometry.LineString([])
+
+    assert line == line  # noqa: PLR0124
+    assert empty != empty  # noqa: PLR0124
+
+
+def test_neq_length() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 2)])
+
+    with mock.patch.object(geometry, "compare_coordinates") as compare:
+        assert line != geometry.LineString([(0, 0), (1, 1)])
+
+    compare.assert_not_called()
+
+
+def test_neq_other_geometry_type() -> None:
+    coords = [(0, 0), (1, 1), (1, 0), (0, 0)]
+
+    assert geometry.LineString(coords) != geometry.LinearRing(coords)
+    assert geometry.LinearRing(coords) != geometry.LineString(coords)
+
+
+def test_empty_points_omitted_2d() -> None:
+    line = geometry.LineString([[0, 0], (None, 1), (1, math.nan), [2.5, 2]])
+
+    assert line.coords == ((0, 0), (2.5, 2))
+    assert all(type(coord) is tuple for coord in line.coords)
+
+
+def test_from_arrays() -> None:
+    line = geometry.LineString.from_arrays([0, 1.5, 3], (2, 3, 4))
+
+    assert line.coords == ((0, 2), (1.5, 3), (3, 4))
+
+
+def test_from_arrays_3d() -> None:
+    line = geometry.LineString.from_arrays(range(2), range(2, 4), [4, 5])
+
+    assert line.coords == ((0, 2, 4), (1, 3, 5))
+
+
+def test_from_arrays_empty() -> None:
+    line = geometry.LineString.from_arrays([], [])
+
+    assert line.is_empty
+
+
+def test_from_arrays_length_mismatch() -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"^The x, y and z sequences must have the same length$",
+    ):
+        geometry.LineString.from_arrays([1, 2, 3], [4, 5], [7])
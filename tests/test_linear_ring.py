@@ -201,3 +201,32 @@ def test_empty_bounds() -> None:
     ring = geometry.LinearRing([])
 
     assert ring.bounds == ()
+
+
+def test_from_linestring_closes_ring() -> None:
+    line = geometry.LineString([(0, 0), (1, 1), (2, 0)])
+
+    ring = geometry.LinearRing(line)
+
+    assert ring.coords == ((0, 0), (1, 1), (2, 0), (0, 0))
+
+
+def test_from_linear_ring_shares_coordinates() -> None:
+    ring = geometry.LinearRing([(0, 0), (1, 1), (2, 0)])
+
+    assert geometry.LinearRing(ring).coords is ring.coords
+
+
+def test_signed_area_cached() -> None:
+    ring = geometry.LinearRing([(0, 0), (1, 0), (1, 1), (0, 1)])
+
+    with mock.patch.object(
+        geometry,
+        "signed_area",
+        wraps=functions.signed_area,
+    ) as area:
+        assert ring.is_ccw
+        assert ring.is_ccw
+        assert ring.centroid == geometry.Point(0.5, 0.5)
+
+    area.assert_called_once_with(ring.coords)
@@ -151,6 +151,16 @@ def test_from_points_unique() -> None:
     )
 
 
+def test_from_points_skips_empty() -> None:
+    multipoint = geometry.MultiPoint.from_points(
+        geometry.Point(0, 0),
+        geometry.Point(1, None),
+        geometry.Point(2, 2),
+    )
+
+    assert multipoint.wkt == "MULTIPOINT ((0 0), (2 2))"
+
+
 def test_empty() -> None:
     multipoint = geometry.MultiPoint([(1, None)])
 
@@ -173,3 +183,28 @@ def test_empty_geoms() -> None:
     multipoint = geometry.MultiPoint([(math.nan, math.nan)])
 
     assert not list(multipoint.geoms)
+
+
+def test_no_instance_dict() -> None:
+    multipoint = geometry.MultiPoint([(0, 0), (1, 1)])
+
+    assert not hasattr(multipoint, "__dict__")
+
+
+def test_bounds_cached() -> None:
+    multipoint = geometry.MultiPoint([(0, 0), (1, 2), (3, -1)])
+
+    assert multipoint.bounds == (0, -1, 3, 2)
+    assert multipoint.bounds is multipoint.bounds
+
+
+def test_wkt_skips_empty_points() -> None:
+    multipoint = geometry.MultiPoint([(0, 0), (1, None), (2.5, 3)])
+
+    assert multipoint.wkt == "MULTIPOINT ((0 0), (2.5 3))"
+
+
+def test_wkt_3d() -> None:
+    multipoint = geometry.MultiPoint([(0, 0, 1), (1, 2, 3.5)])
+
+    assert multipoint.wkt == "MULTIPOINT Z ((0 0 1), (1 2 3.5))"
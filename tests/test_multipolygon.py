@@ -285,3 +285,25 @@ def test_empty_bounds() -> None:
     polys = geometry.MultiPolygon([])
 
     assert polys.bounds == ()
+
+
+def test_geo_interface_coordinates_cached() -> None:
+    polys = geometry.MultiPolygon(
+        [(((0, 0), (1, 1), (1, 0), (0, 0)),), (((0, 0), (2, 2), (2, 0), (0, 0)),)],
+    )
+
+    first = polys.__geo_interface__
+    second = polys.__geo_interface__
+
+    assert first == second
+    assert first is not second
+    assert first["coordinates"] is second["coordinates"]
+
+
+def test_geo_interface_reuses_polygon_coordinates() -> None:
+    polys = geometry.MultiPolygon([(((0, 0), (1, 1), (1, 0), (0, 0)),)])
+    polygon = next(polys.geoms)
+
+    coordinates = polys.__geo_interface__["coordinates"]
+
+    assert coordinates[0] is polygon.__geo_interface__["coordinates"]
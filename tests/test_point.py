@@ -21,6 +21,22 @@ def test_empty_nan() -> None:
     assert point.is_empty
 
 
+@pytest.mark.parametrize(
+    "coords",
+    [
+        (math.nan, 1),
+        (1, math.nan),
+        (math.nan, 1, 2),
+        (1, 2, math.nan),
+        (1, None, 2),
+    ],
+)
+def test_empty_any_coordinate(coords) -> None:
+    point = geometry.Point(*coords)
+
+    assert point.is_empty
+
+
 def test_bool() -> None:
     point = geometry.Point(1.0, 0.0)
 
@@ -245,3 +261,84 @@ def test_empty_bounds() -> None:
     point = geometry.Point(None, None)
 
     assert point.bounds == ()
+
+
+def test_no_instance_dict() -> None:
+    point = geometry.Point(1, 2)
+
+    assert not hasattr(point, "__dict__")
+
+
+def test_from_arrays() -> None:
+    points = geometry.Point.from_arrays([0, 1.5], (2, 3))
+
+    assert points == (geometry.Point(0, 2), geometry.Point(1.5, 3))
+
+
+def test_from_arrays_3d() -> None:
+    points = geometry.Point.from_arrays(range(2), range(2, 4), [4, 5])
+
+    assert points == (geometry.Point(0, 2, 4), geometry.Point(1, 3, 5))
+
+
+def test_from_arrays_empty() -> None:
+    assert geometry.Point.from_arrays([], []) == ()
+
+
+def test_neq_empty_point() -> None:
+    assert geometry.Point(1, 2) != geometry.Point(1, None)
+    assert geometry.Point(1, None) != geometry.Point(1, 2)
+
+
+def test_eq_interface_read_once() -> None:
+    interface = mock.PropertyMock(
+        return_value={"type": "Point", "coordinates": (0.0, 1.0)},
+    )
+    not_a_geometry = mock.Mock()
+    type(not_a_geometry).__geo_interface__ = interface
+
+    assert geometry.Point(0, 1) == not_a_geometry
+    interface.assert_called_once_with()
+
+
+def test_neq_interface_type() -> None:
+    not_a_geometry = mock.Mock()
+    not_a_geometry.__geo_interface__ = {
+        "type": "LineString",
+        "coordinates": (0.0, 1.0),
+    }
+
+    assert geometry.Point(0, 1) != not_a_geometry
+
+
+def test_neq_empty_interface() -> None:
+    not_a_geometry = mock.Mock()
+    not_a_geometry.__geo_interface__ = {
+        "type": "Point",
+        "coordinates": (0.0, 1.0),
+    }
+
+    assert geometry.Point(0, None) != not_a_geometry
+
+
+def test_from_valid_coordinates() -> None:
+    points = geometry.Point._from_valid_coordinates(((0, 1), (2.5, 3, 4)))
+
+    assert points == (geometry.Point(0, 1), geometry.Point(2.5, 3, 4))
+    assert all(type(point) is geometry.Point for point in points)
+
+
+@pytest.mark.parametrize(
+    ("xs", "ys", "zs"),
+    [
+        ([0, 1], [2], None),
+        ([0], [2, 3], None),
+        ([0, 1], [2, 3], [4]),
+    ],
+)
+def test_from_arrays_length_mismatch(xs, ys, zs) -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"^The x, y and z sequences must have the same length$",
+    ):
+        geometry.Point.from_arrays(xs, ys, zs)
@@ -2,7 +2,10 @@
 
 from unittest import mock
 
+import pytest
+
 from pygeoif import geometry
+from pygeoif.exceptions import DimensionError
 
 
 def test_coords() -> None:
@@ -284,3 +287,66 @@ def test_empty_bounds() -> None:
     polygon = geometry.Polygon([])
 
     assert polygon.bounds == ()
+
+
+def test_no_instance_dict() -> None:
+    polygon = geometry.Polygon([(0, 0), (1, 1), (1, 0), (0, 0)])
+
+    assert not hasattr(polygon, "__dict__")
+
+
+def test_shares_rings() -> None:
+    shell = geometry.LinearRing([(0, 0), (3, 0), (3, 3), (0, 3)])
+    hole = geometry.LinearRing([(1, 1), (2, 1), (2, 2), (1, 2)])
+
+    polygon = geometry.Polygon(shell, [hole])
+
+    assert polygon.exterior is shell
+    assert next(polygon.interiors) is hole
+    assert polygon == geometry.Polygon(shell.coords, [hole.coords])
+
+
+def test_geo_interface_coordinates_cached() -> None:
+    polygon = geometry.Polygon(
+        [(0, 0), (3, 0), (3, 3), (0, 3)],
+        [[(1, 1), (2, 1), (2, 2), (1, 2)]],
+    )
+
+    first = polygon.__geo_interface__
+    second = polygon.__geo_interface__
+
+    assert first == second
+    assert first is not second
+    assert first["coordinates"] is second["coordinates"]
+    assert first["coordinates"][0] is polygon.exterior.coords
+
+
+def test_no_geoms_slot() -> None:
+    polygon = geometry.Polygon([(0, 0), (1, 0), (1, 1)])
+
+    assert "_geoms" not in dir(polygon)
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [
+        [(0, 0, None), (1, 0, 1), (1, 1, 1)],
+        [(0, 0, 1), (1, 0, None), (1, 1, 1)],
+    ],
+)
+def test_missing_z_raises(coords) -> None:
+    with pytest.raises(
+        DimensionError,
+        match=r"^3D coordinates must not have a missing z value$",
+    ):
+        geometry.Polygon(coords)
+
+
+def test_from_linear_rings_shares_rings() -> None:
+    shell = geometry.LinearRing([(0, 0), (3, 0), (3, 3), (0, 3)])
+    hole = geometry.LinearRing([(1, 1), (2, 1), (2, 2), (1, 2)])
+
+    polygon = geometry.Polygon.from_linear_rings(shell, hole)
+
+    assert polygon.exterior is shell
+    assert next(polygon.interiors) is hole